@@ -6,19 +6,21 @@
 
 支持特性：
 1. 环境感知：根据 DEBUG 配置自动选择开发/生产环境配置
-2. 优先级排序：通过 priority 字段控制中间件执行顺序（数字越小越先执行）
+2. 优先级排序：通过 priority 字段控制中间件的添加顺序（数字越小越先添加）
 3. 动态启用/禁用：通过 enabled 字段控制中间件是否加载
 4. 配置来自 Settings：所有敏感配置从配置文件读取
 
 优先级说明：
-- 1-10: 日志和监控（最外层，捕获一切）
+- 1-10: 日志和监控
 - 11-20: 安全相关（CORS, TrustedHost, SecurityHeaders）
 - 21-30: 压缩和优化
 - 31+: 其他业务中间件
 
 中间件执行顺序：
-请求流：priority 1 -> 2 -> 3 -> ... -> 路由处理器
-响应流：路由处理器 -> ... -> 3 -> 2 -> 1
+app.py 按 priority 升序调用 add_middleware，Starlette 会把后添加的中间件放在外层，
+因此 priority 越大越靠外、越先处理请求：
+请求流：priority 最大 -> ... -> 2 -> 1 -> 路由处理器
+响应流：路由处理器 -> 1 -> 2 -> ... -> priority 最大
 """
 
 from faster_app.settings import configs
@@ -26,6 +28,15 @@ from faster_app.settings import configs
 # 中间件配置列表
 
 MIDDLEWARES = [
+    # 性能剖析：priority 最大、最后添加，位于最外层，剖析结果覆盖其他全部中间件
+    {
+        "class": "faster_app.middleware.builtins.profiling.ProfilingMiddleware",
+        "priority": 100,
+        "enabled": configs.middleware.profiling.enabled,
+        "kwargs": {
+            "query_param": configs.middleware.profiling.query_param,
+        },
+    },
     # 安全相关
     {
         "class": "fastapi.middleware.cors.CORSMiddleware",
@@ -0,0 +1,91 @@
+"""
+性能剖析中间件
+
+基于 pyinstrument 对单个请求进行采样剖析，并以 HTML 报告替换原响应。
+
+⚠️ 注意：
+- pyinstrument 是可选依赖，需要单独安装：pip install pyinstrument
+- 默认关闭，通过 PROFILING_ENABLED=true 启用，请勿在生产环境启用
+- 启用后也只有携带查询参数（默认 ?profile=1）的请求才会被剖析，其余请求不受影响
+
+使用示例：
+---------
+
+```bash
+PROFILING_ENABLED=true faster server start
+curl "http://127.0.0.1:8000/api/demo/?profile=1" > profile.html
+```
+"""
+
+from collections.abc import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+
+from faster_app.settings import logger
+
+# 查询参数取这些值时触发剖析(不区分大小写),"0"、"false" 等其他值不会触发
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    请求性能剖析中间件
+
+    功能：
+    1. 仅剖析携带指定查询参数的请求
+    2. 使用 async_mode="enabled" 跟踪 await 链路，而不仅仅是事件循环所在线程
+    3. 返回 pyinstrument 生成的 HTML 报告
+    """
+
+    def __init__(self, app, query_param: str = "profile"):
+        """
+        初始化中间件
+
+        Args:
+            app: ASGI 应用
+            query_param: 触发剖析的查询参数名，默认 "profile"
+        """
+        super().__init__(app)
+        self.query_param = query_param
+
+        # 延迟导入可选依赖，未安装时退化为直接透传
+        try:
+            import pyinstrument
+        except ImportError:
+            logger.warning(
+                "[性能剖析] pyinstrument 未安装，剖析中间件不生效: pip install pyinstrument"
+            )
+            pyinstrument = None
+        self.profiler_class = pyinstrument.Profiler if pyinstrument else None
+
+    def _should_profile(self, request: Request) -> bool:
+        """
+        判断请求是否需要剖析
+
+        Args:
+            request: 请求对象
+
+        Returns:
+            查询参数为真值(1/true/yes/on)时返回 True
+        """
+        value = request.query_params.get(self.query_param)
+        return value is not None and value.strip().lower() in _TRUTHY_VALUES
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """处理请求"""
+        if self.profiler_class is None or not self._should_profile(request):
+            return await call_next(request)
+
+        profiler = self.profiler_class(async_mode="enabled")
+        profiler.start()
+        try:
+            response = await call_next(request)
+            # 消费响应体，使流式响应的耗时也计入剖析结果
+            async for _ in response.body_iterator:
+                pass
+        finally:
+            profiler.stop()
+
+        return HTMLResponse(profiler.output_html())
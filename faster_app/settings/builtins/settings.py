@@ -84,6 +84,11 @@ class ThrottleConfig(BaseModel):
         description="限流速率配置",
         validation_alias="THROTTLE_RATES",
     )
+    cache_maxsize: int = Field(
+        default=100_000,
+        description="内存限流缓存最多保存的键数量，超出后淘汰最久未访问的键",
+        validation_alias="THROTTLE_CACHE_MAXSIZE",
+    )
 
 
 class CORSConfig(BaseModel):
@@ -177,6 +182,21 @@ class GZipConfig(BaseModel):
     )
 
 
+class ProfilingConfig(BaseModel):
+    """性能剖析配置（需要安装 pyinstrument）"""
+
+    enabled: bool = Field(
+        default=False,
+        description="是否启用 pyinstrument 性能剖析中间件",
+        validation_alias="PROFILING_ENABLED",
+    )
+    query_param: str = Field(
+        default="profile",
+        description="触发剖析的查询参数名",
+        validation_alias="PROFILING_QUERY_PARAM",
+    )
+
+
 class MiddlewareConfig(BaseModel):
     """中间件配置（统一管理所有中间件配置）"""
 
@@ -185,6 +205,7 @@ class MiddlewareConfig(BaseModel):
     timing: TimingConfig = Field(default_factory=TimingConfig)
     request_logging: RequestLoggingConfig = Field(default_factory=RequestLoggingConfig)
     gzip: GZipConfig = Field(default_factory=GZipConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
 
 
 # 主配置类
@@ -214,6 +235,11 @@ class DefaultSettings(BaseSettings):
     validate_routes: bool = Field(
         default=True, description="是否启用路由冲突检测", validation_alias="VALIDATE_ROUTES"
     )
+    response_orjson: bool = Field(
+        default=False,
+        description="ApiResponse 是否使用 orjson 序列化(需安装 faster_app[orjson])",
+        validation_alias="RESPONSE_ORJSON",
+    )
 
     # 数据库配置相关字段（用于从环境变量读取）
     # 注意：由于 pydantic_settings 的限制，嵌套 BaseModel 中的 validation_alias 无法从环境变量读取
@@ -226,6 +252,21 @@ class DefaultSettings(BaseSettings):
         description="是否启用数据库生命周期",
         validation_alias="ENABLE_DATABASE_LIFESPAN",
     )
+    throttle_cache_maxsize: int = Field(
+        default=100_000,
+        description="限流缓存最多保存的键数量",
+        validation_alias="THROTTLE_CACHE_MAXSIZE",
+    )
+    profiling_enabled: bool = Field(
+        default=False,
+        description="是否启用性能剖析中间件",
+        validation_alias="PROFILING_ENABLED",
+    )
+    profiling_query_param: str = Field(
+        default="profile",
+        description="触发性能剖析的查询参数名",
+        validation_alias="PROFILING_QUERY_PARAM",
+    )
 
     # 嵌套配置
     server: ServerConfig = Field(default_factory=ServerConfig, description="服务器配置")
@@ -242,6 +283,9 @@ class DefaultSettings(BaseSettings):
         # 从顶层字段设置嵌套配置（修复 pydantic_settings 嵌套配置无法读取环境变量的问题）
         self.database.url = self.db_url
         self.lifespan.enable_database = self.enable_database_lifespan
+        self.throttle.cache_maxsize = self.throttle_cache_maxsize
+        self.middleware.profiling.enabled = self.profiling_enabled
+        self.middleware.profiling.query_param = self.profiling_query_param
 
         if not self.debug:
             # 生产环境检查
@@ -5,12 +5,208 @@ This module provides a consistent API response format for all endpoints,
 including success and error responses.
 """
 
+import json
 from datetime import datetime
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi.responses import JSONResponse
 
+from faster_app.settings import configs, logger
+
+if TYPE_CHECKING:
+    import orjson
+else:
+    try:
+        import orjson
+    except ImportError:  # orjson 为可选依赖: pip install "faster_app[orjson]"
+        orjson = None
+
+# 默认 HTTP 状态码使用普通 int,响应对象上不再携带 IntEnum
+_HTTP_OK = int(HTTPStatus.OK)
+_HTTP_INTERNAL_SERVER_ERROR = int(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+# 只有显式开启 RESPONSE_ORJSON 时才使用 orjson,输出格式不随环境中是否安装 orjson 而变化
+_USE_ORJSON = configs.response_orjson and orjson is not None
+if configs.response_orjson and orjson is None:
+    logger.warning(
+        '[响应序列化] RESPONSE_ORJSON 已开启但未安装 orjson: pip install "faster_app[orjson]"'
+    )
+
+# datetime、dataclass 和 str/int/dict 等内置类型的子类交给标准库处理,与默认行为保持一致
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _dumps(content: Any) -> bytes:
+    """
+    将内容序列化为紧凑的 UTF-8 JSON bytes
+
+    默认使用标准库 json,输出格式与 Starlette JSONResponse 一致。
+    开启 RESPONSE_ORJSON 并安装 orjson 后优先使用 orjson,orjson 无法处理的内容
+    (超过 64 位的整数、datetime、内置类型的子类等)回退到标准库。
+
+    Args:
+        content: 需要序列化的内容
+
+    Returns:
+        JSON bytes
+
+    Note:
+        使用 orjson 时与标准库的差异:
+        - NaN/Infinity 输出为 null,标准库会抛出 ValueError
+        - UUID 和 Enum 直接序列化为字符串/值,标准库会抛出 TypeError
+    """
+    if _USE_ORJSON:
+        try:
+            return orjson.dumps(content, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class _ApiJSONResponse(JSONResponse):
+    """使用 _dumps 渲染的 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+# 响应信封的固定片段,字段顺序与 dict 版本一致: success, code, message, data, timestamp
+# 响应体统一用 b"".join 拼接片段,只分配一次,避免逐个 + 产生中间 bytes 对象
+_SUCCESS_PREFIX = b'{"success":true,"code":'
+_ERROR_PREFIX = b'{"success":false,"code":'
+_MESSAGE_KEY = b',"message":'
+_DATA_KEY = b',"data":'
+_TIMESTAMP_KEY = b',"timestamp":"'
+_ERROR_DETAIL_KEY = b'","error_detail":'
+_END = b'"}'
+
+# 分页数据的固定片段: items, total, page, size, pages
+_ITEMS_KEY = b'{"items":'
+_TOTAL_KEY = b',"total":'
+_PAGE_KEY = b',"page":'
+_SIZE_KEY = b',"size":'
+_PAGES_KEY = b',"pages":'
+
+
+# 常见小整数(页码、每页数量、业务码等)预先渲染好的 bytes
+_INT_BYTES: tuple[bytes, ...] = tuple(str(i).encode() for i in range(1024))
+
+
+def _int_bytes(value: int | None) -> bytes:
+    """将整数(或 None)渲染为 JSON bytes,0-1023 直接查表"""
+    if value is None:
+        return b"null"
+    if 0 <= value < 1024:
+        return _INT_BYTES[value]
+    return str(value).encode()
+
+
+# 无需转义的 ASCII 字符(可打印字符中除去 " 和 \),translate 时全部删除
+_JSON_SAFE_ASCII = dict.fromkeys(c for c in range(0x20, 0x7F) if c not in (0x22, 0x5C))
+
+
+def _dumps_str(value: str) -> bytes:
+    """
+    将字符串渲染为 JSON bytes
+
+    纯 ASCII 且不含引号、反斜杠和控制字符的字符串无需转义,直接加引号输出;
+    translate 删除所有安全字符后为空即说明无需转义,检查在 C 层一次完成。
+
+    Args:
+        value: 字符串
+
+    Returns:
+        JSON 字符串 bytes(包含引号)
+    """
+    if value.isascii() and not value.translate(_JSON_SAFE_ASCII):
+        return b'"' + value.encode() + b'"'
+    return _dumps(value)
+
+
+@lru_cache(maxsize=512)
+def _envelope_head(success: bool, code: int, message: str) -> bytes:
+    """
+    渲染响应信封中 data 之前的部分(按 success、code 和 message 缓存)
+
+    Args:
+        success: 是否成功
+        code: 业务状态码
+        message: 提示信息
+
+    Returns:
+        以 `,"data":` 结尾的 bytes 片段
+
+    Note:
+        timestamp 每次请求都不同,只缓存与请求无关的前缀,不缓存完整响应体
+    """
+    prefix = _SUCCESS_PREFIX if success else _ERROR_PREFIX
+    return prefix + _int_bytes(code) + _MESSAGE_KEY + _dumps_str(message) + _DATA_KEY
+
+
+def _render_head(success: bool, code: Any, message: Any) -> bytes:
+    """
+    渲染响应信封中 data 之前的部分
+
+    只有 message 为 str、code 为 int 时才走 _envelope_head 缓存,
+    其他类型(None、dict、bool 等)不一定可哈希,统一交给 _dumps 序列化。
+
+    Args:
+        success: 是否成功
+        code: 业务状态码
+        message: 提示信息
+
+    Returns:
+        以 `,"data":` 结尾的 bytes 片段
+    """
+    if type(message) is str and type(code) is int:
+        return _envelope_head(success, code, message)
+    prefix = _SUCCESS_PREFIX if success else _ERROR_PREFIX
+    return prefix + _dumps(code) + _MESSAGE_KEY + _dumps(message) + _DATA_KEY
+
+
+_CONTENT_TYPE_HEADER = (b"content-type", b"application/json")
+
+
+def _json_response(body: bytes, status_code: int) -> JSONResponse:
+    """
+    使用已渲染的响应体创建 JSONResponse
+
+    响应体和 content-type 都是已知的,直接设置 raw_headers,
+    跳过 Response.__init__ 中的 render 和 init_headers。
+
+    Args:
+        body: 已渲染的 JSON bytes
+        status_code: HTTP 状态码
+
+    Returns:
+        JSONResponse 实例
+    """
+    response = _ApiJSONResponse.__new__(_ApiJSONResponse)
+    response.status_code = status_code
+    response.background = None
+    response.body = body
+    # 与 Starlette 一致: 1xx、204、304 响应不设置 content-length
+    if status_code < 200 or status_code in (204, 304):
+        response.raw_headers = [_CONTENT_TYPE_HEADER]
+    else:
+        response.raw_headers = [(b"content-length", _int_bytes(len(body))), _CONTENT_TYPE_HEADER]
+    return response
+
 
 class ApiResponse:
     """Utility class for creating standardized API responses.
@@ -30,7 +226,7 @@ class ApiResponse:
         data: Any = None,
         message: str = "操作成功",
         code: int = 200,
-        status_code: int = HTTPStatus.OK,
+        status_code: int = _HTTP_OK,
     ) -> JSONResponse:
         """
         Create a successful API response.
@@ -47,20 +243,86 @@ class ApiResponse:
         Example:
             >>> ApiResponse.success(data={"user_id": 123}, message="User created")
         """
-        response_data = {
-            "success": True,
-            "code": code,
-            "message": message,
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-        }
-        return JSONResponse(content=response_data, status_code=status_code)
+        # 信封结构固定,直接拼接 bytes,前缀按 code/message 缓存,只有 data 需要序列化
+        body = b"".join(
+            (
+                _render_head(True, code, message),
+                _dumps(data),
+                _TIMESTAMP_KEY,
+                datetime.now().isoformat().encode(),
+                _END,
+            )
+        )
+        return _json_response(body, status_code)
+
+    @staticmethod
+    def paginated(
+        items: list[Any],
+        total: int | None,
+        page: int | None,
+        size: int | None,
+        pages: int | None = None,
+        message: str = "查询成功",
+        code: int = 200,
+        status_code: int = _HTTP_OK,
+    ) -> JSONResponse:
+        """
+        Create a successful paginated API response.
+
+        data 的结构为 {"items", "total", "page", "size", "pages"},
+        与 fastapi_pagination 的 Page 字段一致。
+
+        Args:
+            items: 当前页的数据列表(需已转换为可 JSON 序列化的类型)
+            total: 总记录数(未统计时为 None)
+            page: 当前页码
+            size: 每页数量
+            pages: 总页数(通常直接传入 Page.pages;未传入时按 Page.create 的规则计算)
+            message: Success message (default: "查询成功")
+            code: Business status code (default: 200)
+            status_code: HTTP status code (default: 200 OK)
+
+        Returns:
+            JSONResponse with standardized success format
+
+        Example:
+            >>> ApiResponse.paginated(items=[{"id": 1}], total=1, page=1, size=50)
+        """
+        if pages is None:
+            # 与 Page.create 一致: size 为 0 或 None 时为 0,未统计 total 时为 None;
+            # 整数向上取整,避免浮点除法和大数精度问题
+            if not size:
+                pages = 0
+            elif total is not None:
+                pages = -(-total // size)
+
+        # 分页字段都是整数,直接拼接 bytes,只有 items 需要序列化
+        body = b"".join(
+            (
+                _render_head(True, code, message),
+                _ITEMS_KEY,
+                _dumps(items),
+                _TOTAL_KEY,
+                _int_bytes(total),
+                _PAGE_KEY,
+                _int_bytes(page),
+                _SIZE_KEY,
+                _int_bytes(size),
+                _PAGES_KEY,
+                _int_bytes(pages),
+                b"}",
+                _TIMESTAMP_KEY,
+                datetime.now().isoformat().encode(),
+                _END,
+            )
+        )
+        return _json_response(body, status_code)
 
     @staticmethod
     def error(
         message: str = "操作失败",
         code: int = 500,
-        status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR,
+        status_code: int = _HTTP_INTERNAL_SERVER_ERROR,
         error_detail: str | None = None,
         data: Any = None,
     ) -> JSONResponse:
@@ -99,16 +361,22 @@ class ApiResponse:
             >>> from faster_app.exceptions import NotFoundError
             >>> raise NotFoundError(message="资源未找到")
         """
-        response_data = {
-            "success": False,
-            "code": code,
-            "message": message,
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-        }
+        parts = [
+            _render_head(False, code, message),
+            _dumps(data),
+            _TIMESTAMP_KEY,
+            datetime.now().isoformat().encode(),
+        ]
 
         # 如果有详细错误信息, 添加到响应中
         if error_detail:
-            response_data["error_detail"] = error_detail
+            detail = (
+                _dumps_str(error_detail) if isinstance(error_detail, str) else _dumps(error_detail)
+            )
+            parts += (_ERROR_DETAIL_KEY, detail, b"}")
+        else:
+            parts.append(_END)
+
+        body = b"".join(parts)
 
-        return JSONResponse(content=response_data, status_code=status_code)
+        return _json_response(body, status_code)
@@ -39,6 +39,8 @@ from faster_app.viewsets.routers import as_router
 from faster_app.viewsets.throttling import (
     AnonRateThrottle,
     BaseThrottle,
+    BaseThrottleBackend,
+    MemoryThrottleBackend,
     MultiRateThrottle,
     NoThrottle,
     ScopedRateThrottle,
@@ -86,6 +88,8 @@ __all__ = [
     "AnonRateThrottle",
     "ScopedRateThrottle",
     "MultiRateThrottle",
+    "BaseThrottleBackend",
+    "MemoryThrottleBackend",
     # 装饰器和工具
     "action",
     "as_router",
@@ -51,6 +51,7 @@ def action(
         func.action = True
         func.action_methods = methods
         func.action_detail = detail
+        # 在装饰时计算 URL 路径,路由注册时直接读取
         func.action_url_path = url_path or func.__name__.replace("_", "-")
         func.action_url_name = url_name or func.__name__
         func.action_kwargs = kwargs
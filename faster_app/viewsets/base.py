@@ -5,7 +5,8 @@ ViewSet 基类
 """
 
 from abc import ABC
-from typing import Any, TypeVar
+from collections.abc import Sequence
+from typing import Any, ClassVar, TypeVar
 
 from fastapi import Request
 from pydantic import BaseModel
@@ -46,10 +47,10 @@ class ViewSet(ABC):  # noqa: B024
     permission_classes: list[type[BasePermission]] = [AllowAny]
     authentication_classes: list[type[BaseAuthentication]] = [NoAuthentication]
 
-    # 过滤和排序(可选)
-    filter_backends: list[type[BaseFilterBackend]] = []
-    search_fields: list[str] = []
-    ordering_fields: list[str] = []
+    # 过滤和排序(可选,空默认值使用元组,避免共享可变对象)
+    filter_backends: Sequence[type[BaseFilterBackend]] = ()
+    search_fields: Sequence[str] = ()
+    ordering_fields: Sequence[str] = ()
     ordering: list[str] = []
     filter_fields: dict[str, str] = {}
 
@@ -57,9 +58,27 @@ class ViewSet(ABC):  # noqa: B024
     throttle_classes: list[type[BaseThrottle] | BaseThrottle] = [NoThrottle]
     throttle_scope: str | None = None
 
+    # 是否在请求间复用同一个 ViewSet 实例(需要在实例上保存请求级状态时设为 False)
+    reuse_instance: bool = True
+
     # Schema 缓存(类级别,避免重复生成)
     _schema_cache: dict[str, type[PydanticModel]] = {}
 
+    # 是否定义了 @action 自定义操作(在子类创建时计算)
+    _has_custom_actions: bool = False
+
+    # 路由注册计划(首次 as_router 时由 ViewSetRouter 按类生成并缓存,之后不再更新)
+    _registration_plan: ClassVar[Any] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """子类创建时标记是否包含 @action 方法,没有 action 的 ViewSet 注册路由时可跳过扫描"""
+        super().__init_subclass__(**kwargs)
+        cls._has_custom_actions = any(
+            getattr(value, "action", False)
+            for klass in cls.__mro__
+            for value in vars(klass).values()
+        )
+
     def __init__(self):
         """初始化 ViewSet"""
         if self.model is None:
@@ -67,16 +86,41 @@ class ViewSet(ABC):  # noqa: B024
 
         # 如果没有提供 Schema,自动生成(使用缓存避免重复生成)
         if self.schema is None:
-            cache_key = f"{self.model.__name__}_Response"
-            if cache_key not in self._schema_cache:
-                self._schema_cache[cache_key] = pydantic_model_creator(
-                    self.model, name=f"{self.model.__name__}Response"
-                )
-            self.schema = self._schema_cache[cache_key]
+            self.schema = self.get_default_schema()
 
         # create_schema 和 update_schema 不自动生成
         # 如果未提供,会在 get_schema 中回退到 schema
 
+    @classmethod
+    def get_default_schema(cls) -> type[PydanticModel] | None:
+        """
+        根据模型自动生成响应 Schema(类级别缓存)
+
+        Returns:
+            Schema 类,未定义 model 时返回 None
+        """
+        if cls.model is None:
+            return None
+        cache_key = f"{cls.model.__name__}_Response"
+        if cache_key not in cls._schema_cache:
+            cls._schema_cache[cache_key] = pydantic_model_creator(
+                cls.model, name=f"{cls.model.__name__}Response"
+            )
+        return cls._schema_cache[cache_key]
+
+    @classmethod
+    def get_schema_for(cls, kind: str) -> type[BaseModel] | None:
+        """
+        在类级别获取指定操作的 Schema(无需实例化 ViewSet)
+
+        Args:
+            kind: Schema 类型('create' 或 'update')
+
+        Returns:
+            Schema 类,未定义时回退到 schema
+        """
+        return getattr(cls, f"{kind}_schema", None) or cls.schema or cls.get_default_schema()
+
     def get_queryset(self) -> Any:
         """
         获取查询集(可被子类重写)
@@ -314,6 +358,9 @@ class ViewSet(ABC):  # noqa: B024
             TooManyRequestsError: 请求频率过高
         """
         for throttle in self.get_throttles():
+            # 已禁用的限流(如 NoThrottle)无需创建协程
+            if getattr(throttle, "disabled", False):
+                continue
             if not await throttle.allow_request(request, self):
                 wait_time = throttle.wait()
                 raise TooManyRequestsError(
@@ -5,6 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from fastapi import Request
@@ -44,9 +45,9 @@ class SearchFilter(BaseFilterBackend):
     """
 
     search_param = "search"
-    search_fields: list[str] = []
+    search_fields: Sequence[str] = ()
 
-    def __init__(self, search_param: str | None = None, search_fields: list[str] | None = None):
+    def __init__(self, search_param: str | None = None, search_fields: Sequence[str] | None = None):
         """
         初始化搜索过滤
 
@@ -117,13 +118,13 @@ class OrderingFilter(BaseFilterBackend):
     """
 
     ordering_param = "ordering"
-    ordering_fields: list[str] = []
+    ordering_fields: Sequence[str] = ()
     ordering: list[str] = []  # 默认排序
 
     def __init__(
         self,
         ordering_param: str | None = None,
-        ordering_fields: list[str] | None = None,
+        ordering_fields: Sequence[str] | None = None,
         ordering: list[str] | None = None,
     ):
         """
@@ -68,17 +68,12 @@ class ListModelMixin:
             (await schema.from_orm_model(item)).model_dump(mode="json") for item in page.items
         ]
 
-        # 创建分页数据
-        page_data = {
-            "items": serialized_items,
-            "total": page.total,
-            "page": page.page,
-            "size": page.size,
-            "pages": page.pages,
-        }
-
-        return ApiResponse.success(
-            data=page_data,
+        return ApiResponse.paginated(
+            items=serialized_items,
+            total=page.total,
+            page=page.page,
+            size=page.size,
+            pages=page.pages,
             message="查询成功",
         )
 
@@ -4,7 +4,10 @@ ViewSet 路由注册
 提供将 ViewSet 转换为 FastAPI Router 的功能。
 """
 
-from typing import Any
+import inspect
+from collections.abc import Callable
+from functools import cache, wraps
+from typing import Any, NamedTuple
 
 from fastapi import APIRouter, Depends, Query, Request, Security
 from fastapi.security import HTTPBearer
@@ -25,6 +28,223 @@ from faster_app.viewsets.mixins import (
 # 模块级别的默认实例,用于避免在函数参数默认值中调用函数
 _DEFAULT_PAGINATION = Params()
 
+# 共享的 JWT 安全依赖(用于 Swagger UI 的 Authorize 按钮)
+# 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
+_HTTP_BEARER = HTTPBearer(auto_error=False)
+_AUTH_DEPS_JWT: list[Any] = [Security(_HTTP_BEARER)]
+
+# 注册自定义 action 时需要跳过的保留方法名
+_RESERVED_METHOD_NAMES = frozenset(
+    {
+        "get_queryset",
+        "get_object",
+        "get_schema",
+        "get_object_name",
+        "list",
+        "create",
+        "retrieve",
+        "update",
+        "partial_update",
+        "destroy",
+    }
+)
+
+
+async def _pagination_params(
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=100),
+) -> Params:
+    """
+    列表路由的分页参数依赖
+
+    查询参数与 Params 的定义保持一致,由 FastAPI 逐个校验后直接构造 Params,
+    避免 Depends(Params) 在每次请求时再做一次完整的 Pydantic 模型校验。
+
+    Args:
+        page: 页码
+        size: 每页数量
+
+    Returns:
+        分页参数
+    """
+    return Params.model_construct(page=page, size=size)
+
+
+def _needs_jwt_auth(viewset_class: type[ViewSet]) -> bool:
+    """
+    检查 ViewSet 是否需要 JWT 认证(用于 Swagger UI 的 Authorize 按钮)
+
+    Args:
+        viewset_class: ViewSet 类
+
+    Returns:
+        是否配置了 JWTAuthentication
+    """
+    return any(
+        isinstance(auth_class, type)
+        and issubclass(auth_class, JWTAuthentication)
+        or isinstance(auth_class, JWTAuthentication)
+        for auth_class in viewset_class.authentication_classes
+    )
+
+
+@cache
+def _action_signature(action_method: Callable) -> tuple[inspect.Parameter, ...]:
+    """
+    解析 action 方法的参数(按方法缓存)
+
+    Args:
+        action_method: 使用 @action 装饰的方法
+
+    Returns:
+        handler 函数参数(不包括 self)
+    """
+    return tuple(inspect.signature(action_method).parameters.values())[1:]  # 跳过 self
+
+
+async def _prepare_action(
+    viewset: ViewSet, request: Request, pk: Any, is_detail: bool, action_name: str
+) -> None:
+    """
+    执行 action 调用前的限流、认证和权限检查
+
+    Args:
+        viewset: ViewSet 实例
+        request: FastAPI 请求对象
+        pk: 对象主键(仅对象级操作使用)
+        is_detail: 是否是对象级操作
+        action_name: action 名称
+    """
+    # 检查限流
+    await viewset.check_throttles(request)
+    # 执行认证和权限检查
+    await viewset.perform_authentication(request)
+    await viewset.check_permissions(request, action_name)
+
+    # 如果是对象级操作,获取对象并检查对象权限
+    if is_detail:
+        instance = await viewset.get_object(pk)
+        if instance:
+            await viewset.check_object_permissions(request, instance, action_name)
+
+
+def _compile_action_handler(
+    action_method: Callable,
+    action_name: str,
+    is_detail: bool,
+    get_viewset: Callable[[], ViewSet],
+) -> Callable:
+    """
+    生成与 action 方法签名一致的路由处理函数
+
+    通过生成源码并编译得到原生签名的函数,请求时按参数直接调用 action,
+    无需 **kwargs 打包和逐个取参。注解和默认值通过命名空间引用,
+    命名空间基于 action 所在模块的全局变量,字符串形式的注解也能正确解析。
+
+    Args:
+        action_method: 使用 @action 装饰的方法
+        action_name: action 名称
+        is_detail: 是否是对象级操作
+        get_viewset: ViewSet 实例提供函数
+
+    Returns:
+        路由处理函数
+    """
+    namespace = dict(inspect.unwrap(action_method).__globals__)
+    namespace.update(
+        _fa_action=action_method,
+        _fa_prepare=_prepare_action,
+        _fa_get_viewset=get_viewset,
+        _fa_is_detail=is_detail,
+        _fa_action_name=action_name,
+    )
+
+    func_params = _action_signature(action_method)
+    param_names = {param.name for param in func_params}
+    params_src: list[str] = []
+    call_src: list[str] = []
+    keyword_only = False
+    for i, param in enumerate(func_params):
+        param_src = param.name
+        if param.annotation is not inspect.Parameter.empty:
+            namespace[f"_fa_annotation_{i}"] = param.annotation
+            param_src += f": _fa_annotation_{i}"
+        if param.default is not inspect.Parameter.empty:
+            namespace[f"_fa_default_{i}"] = param.default
+            param_src += f" = _fa_default_{i}"
+
+        if param.kind is inspect.Parameter.KEYWORD_ONLY:
+            if not keyword_only:
+                params_src.append("*")
+                keyword_only = True
+            call_src.append(f"{param.name}={param.name}")
+        else:
+            call_src.append(param.name)
+        params_src.append(param_src)
+
+    request_src = "request" if "request" in param_names else "None"
+    pk_src = "pk" if "pk" in param_names else "None"
+    source = (
+        f"async def base_handler({', '.join(params_src)}):\n"
+        f"    _fa_viewset = _fa_get_viewset()\n"
+        f"    await _fa_prepare(_fa_viewset, {request_src}, {pk_src}, _fa_is_detail, _fa_action_name)\n"
+        f"    return await _fa_action(_fa_viewset, {', '.join(call_src)})\n"
+    )
+    exec(compile(source, f"<action {action_name}>", "exec"), namespace)
+    return namespace["base_handler"]
+
+
+def _viewset_provider(viewset_class: type[ViewSet]) -> Callable[[], ViewSet]:
+    """
+    获取处理请求时使用的 ViewSet 实例提供函数
+
+    Args:
+        viewset_class: ViewSet 类
+
+    Returns:
+        无参函数,返回 ViewSet 实例
+
+    Note:
+        reuse_instance 为 True 时,实例在首次请求时创建并在之后的请求中复用;
+        否则每次调用都创建新的实例
+    """
+    if not viewset_class.reuse_instance:
+        return viewset_class
+
+    instance: ViewSet | None = None
+
+    def get_viewset() -> ViewSet:
+        nonlocal instance
+        if instance is None:
+            instance = viewset_class()
+        return instance
+
+    return get_viewset
+
+
+class _ActionRoute(NamedTuple):
+    """自定义 action 的路由信息(注册时直接使用,无需重复计算)"""
+
+    path: str
+    methods: tuple[str, ...]
+    handler: Callable
+    route_kwargs: dict[str, Any]
+
+
+class _RegistrationPlan(NamedTuple):
+    """ViewSet 路由注册计划(每个 ViewSet 类只计算一次)"""
+
+    needs_auth: bool
+    has_list: bool
+    has_create: bool
+    has_retrieve: bool
+    has_update: bool
+    has_destroy: bool
+    filter_params: dict[str, Any]
+    actions: tuple[_ActionRoute, ...]
+    schemas: dict[str, type[BaseModel]]
+    get_viewset: Callable[[], ViewSet]
+
 
 class ViewSetRouter:
     """
@@ -33,6 +253,8 @@ class ViewSetRouter:
     将 ViewSet 转换为 FastAPI Router
     """
 
+    __slots__ = ("viewset_class", "prefix", "tags", "operations")
+
     def __init__(
         self,
         viewset_class: type[ViewSet],
@@ -62,63 +284,111 @@ class ViewSetRouter:
             APIRouter 实例
 
         Note:
-            ViewSet 实例在每次请求时创建,确保无状态性和线程安全。
-
-            性能优化说明：
-            - ViewSet 类已经在类级别缓存了无状态组件(权限、认证、过滤后端等),
-              所以实例创建的开销主要是对象初始化,性能影响较小
-            - 如果性能成为瓶颈,可以考虑：
-              1. 使用 FastAPI 的依赖注入系统管理 ViewSet 生命周期
-              2. 使用单例模式(仅当 ViewSet 完全无状态时,需谨慎)
-              3. 添加性能测试验证当前实现是否满足需求
+            默认所有请求复用同一个 ViewSet 实例(首次请求时创建),避免每次请求
+            重复初始化。ViewSet 必须保持无状态,请求相关数据通过 request 传递。
+
+            如果 ViewSet 需要在实例上保存请求级状态,设置 reuse_instance = False,
+            此时每次请求都会创建新的 ViewSet 实例。
         """
         router = APIRouter(prefix=self.prefix, tags=self.tags)
-
-        # 创建一个临时实例用于检查类型和获取序列化器类
-        temp_instance = self.viewset_class()
-
-        # 检查是否需要 JWT 认证(用于 Swagger UI 的 Authorize 按钮)
-        any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
+        plan = self._get_plan(self.viewset_class)
 
         # 先注册自定义 action 路由(更具体的路由先注册,避免被通配路由捕获)
-        self._register_custom_actions(router, self.viewset_class)
+        self._register_custom_actions(router, self.viewset_class, plan)
 
-        # 注册标准 CRUD 路由(每次请求创建新实例)
-        if "L" in self.operations and isinstance(temp_instance, ListModelMixin):
-            self._register_list_route(router, self.viewset_class)
+        # 注册标准 CRUD 路由
+        if "L" in self.operations and plan.has_list:
+            self._register_list_route(router, self.viewset_class, plan)
 
-        if "C" in self.operations and isinstance(temp_instance, CreateModelMixin):
-            self._register_create_route(router, self.viewset_class)
+        if "C" in self.operations and plan.has_create:
+            self._register_create_route(router, self.viewset_class, plan)
 
-        if "R" in self.operations and isinstance(temp_instance, RetrieveModelMixin):
-            self._register_retrieve_route(router, self.viewset_class)
+        if "R" in self.operations and plan.has_retrieve:
+            self._register_retrieve_route(router, self.viewset_class, plan)
 
-        if "U" in self.operations and isinstance(temp_instance, UpdateModelMixin):
-            self._register_update_route(router, self.viewset_class)
-            self._register_partial_update_route(router, self.viewset_class)
+        if "U" in self.operations and plan.has_update:
+            self._register_update_route(router, self.viewset_class, plan)
+            self._register_partial_update_route(router, self.viewset_class, plan)
 
-        if "D" in self.operations and isinstance(temp_instance, DestroyModelMixin):
-            self._register_destroy_route(router, self.viewset_class)
+        if "D" in self.operations and plan.has_destroy:
+            self._register_destroy_route(router, self.viewset_class, plan)
 
         return router
 
-    def _get_filter_query_params(self, viewset_instance: ViewSet) -> dict[str, Any]:
+    def _get_plan(self, viewset_class: type[ViewSet]) -> _RegistrationPlan:
+        """
+        获取 ViewSet 的路由注册计划(按类缓存)
+
+        Args:
+            viewset_class: ViewSet 类
+
+        Returns:
+            路由注册计划
+
+        Note:
+            - 使用 vars() 读取缓存,避免子类复用父类的注册计划
+            - 计划在首次构建后即固定,之后修改 ViewSet 的类属性(认证类、过滤配置、
+              Schema 等)不会反映到后续 as_router 生成的路由中,应在注册路由前完成配置
+        """
+        plan = vars(viewset_class).get("_registration_plan")
+        if plan is None:
+            plan = self._build_plan(viewset_class)
+            viewset_class._registration_plan = plan
+        return plan
+
+    def _build_plan(self, viewset_class: type[ViewSet]) -> _RegistrationPlan:
+        """
+        构建路由注册计划
+
+        所有信息都从类上读取,一次性计算认证、Mixin 类型、过滤参数、
+        自定义 action 和 Schema 等注册所需的信息,不会实例化 ViewSet。
+
+        Args:
+            viewset_class: ViewSet 类
+
+        Returns:
+            路由注册计划
+
+        Raises:
+            ValueError: ViewSet 未定义 model 属性
+        """
+        # 与 ViewSet.__init__ 的校验保持一致,在注册阶段尽早报错
+        if viewset_class.model is None:
+            raise ValueError(f"{viewset_class.__name__} 必须定义 model 属性")
+
+        needs_auth = _needs_jwt_auth(viewset_class)
+        get_viewset = _viewset_provider(viewset_class)
+
+        return _RegistrationPlan(
+            needs_auth=needs_auth,
+            has_list=issubclass(viewset_class, ListModelMixin),
+            has_create=issubclass(viewset_class, CreateModelMixin),
+            has_retrieve=issubclass(viewset_class, RetrieveModelMixin),
+            has_update=issubclass(viewset_class, UpdateModelMixin),
+            has_destroy=issubclass(viewset_class, DestroyModelMixin),
+            filter_params=self._get_filter_query_params(viewset_class),
+            actions=self._build_action_routes(viewset_class, needs_auth, get_viewset),
+            schemas={
+                "create": self._get_schema(viewset_class, "create"),
+                "update": self._get_schema(viewset_class, "update"),
+            },
+            get_viewset=get_viewset,
+        )
+
+    def _get_filter_query_params(self, viewset_class: type[ViewSet]) -> dict[str, Any]:
         """
         根据 ViewSet 的过滤配置生成查询参数
 
+        过滤配置都是类属性,直接从类上读取,无需实例化 ViewSet。
+
         Args:
-            viewset_instance: ViewSet 实例
+            viewset_class: ViewSet 类
 
         Returns:
             查询参数字典,用于 FastAPI 路由
         """
         query_params = {}
-        filter_backends = getattr(viewset_instance, "filter_backends", [])
+        filter_backends = viewset_class.filter_backends
 
         for backend in filter_backends:
             # 如果 backend 是类,需要实例化以获取属性
@@ -128,7 +398,7 @@ class ViewSetRouter:
             if isinstance(backend_instance, SearchFilter) or (
                 isinstance(backend, type) and issubclass(backend, SearchFilter)
             ):
-                search_fields = getattr(viewset_instance, "search_fields", [])
+                search_fields = viewset_class.search_fields
                 if search_fields:
                     search_param = backend_instance.search_param
                     query_params[search_param] = Query(
@@ -140,7 +410,7 @@ class ViewSetRouter:
             if isinstance(backend_instance, OrderingFilter) or (
                 isinstance(backend, type) and issubclass(backend, OrderingFilter)
             ):
-                ordering_fields = getattr(viewset_instance, "ordering_fields", [])
+                ordering_fields = viewset_class.ordering_fields
                 if ordering_fields:
                     ordering_param = backend_instance.ordering_param
                     query_params[ordering_param] = Query(
@@ -152,7 +422,7 @@ class ViewSetRouter:
             if isinstance(backend_instance, FieldFilter) or (
                 isinstance(backend, type) and issubclass(backend, FieldFilter)
             ):
-                filter_fields = getattr(viewset_instance, "filter_fields", {})
+                filter_fields = viewset_class.filter_fields
                 if filter_fields:
                     for field_name, filter_type in filter_fields.items():
                         # 根据过滤类型生成描述
@@ -173,30 +443,23 @@ class ViewSetRouter:
 
         return query_params
 
-    def _register_list_route(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
+    def _register_list_route(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
         """注册列表路由"""
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        # 获取过滤查询参数配置
-        filter_params = self._get_filter_query_params(temp_instance)
+        filter_params = plan.filter_params
 
         # 构建函数参数：request, pagination, 以及所有过滤参数
-        # 使用 functools.partial 或者直接构建函数签名
-        import inspect
-        from functools import wraps
-
         # 创建基础函数
-        # 使用 Depends() 让 FastAPI 自动注入 Params 实例
-        async def base_list_view(request: Request, pagination: Params = Depends()):  # noqa: B008
-            viewset = viewset_class()
+        # 通过 _pagination_params 注入 Params 实例
+        async def base_list_view(
+            request: Request,
+            pagination: Params = Depends(_pagination_params),  # noqa: B008
+        ):
+            viewset = get_viewset()
             return await viewset.list(request, pagination)
 
         # 如果有过滤参数,需要动态添加
@@ -221,7 +484,7 @@ class ViewSetRouter:
             async def list_view(*args, **kwargs):
                 # 提取 request 和 pagination,忽略过滤参数(ViewSet 会从 request.query_params 读取)
                 request_arg = None
-                pagination_arg = Params()
+                pagination_arg = _DEFAULT_PAGINATION
 
                 # 从位置参数中查找
                 for arg in args:
@@ -237,7 +500,7 @@ class ViewSetRouter:
                     pagination_arg = kwargs["pagination"]
 
                 if request_arg:
-                    viewset = viewset_class()
+                    viewset = get_viewset()
                     return await viewset.list(request_arg, pagination_arg)
 
                 # 回退到原始调用
@@ -248,7 +511,7 @@ class ViewSetRouter:
             list_view = base_list_view
 
         # 直接注册 list_view,保持其函数签名
-        router.get("/", dependencies=security)(list_view)
+        router.add_api_route("/", list_view, methods=["GET"], dependencies=security)
 
     def _get_schema(
         self, viewset_class: type[ViewSet], schema_type: str = "create"
@@ -262,234 +525,186 @@ class ViewSetRouter:
 
         Returns:
             Schema 类
+
+        Note:
+            Schema 是类级别属性,直接从类读取,无需实例化 ViewSet
         """
-        temp_instance = viewset_class()
-        if schema_type == "create":
-            return temp_instance.create_schema or temp_instance.schema
-        else:  # update
-            return temp_instance.update_schema or temp_instance.schema
+        return viewset_class.get_schema_for(schema_type)
 
-    def _register_create_route(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
+    def _register_create_route(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
         """注册创建路由"""
-        schema = self._get_schema(viewset_class, "create")
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        schema = plan.schemas["create"]
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        @router.post("/", dependencies=security)
         async def create_view(request: Request, create_data: schema):
-            # 每次请求创建新的 ViewSet 实例,确保无状态
-            viewset = viewset_class()
+            viewset = get_viewset()
             return await viewset.create(request, create_data)
 
-    def _register_retrieve_route(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
+        router.add_api_route("/", create_view, methods=["POST"], dependencies=security)
+
+    def _register_retrieve_route(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
         """注册单个查询路由"""
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        @router.get("/{pk}", dependencies=security)
         async def retrieve_view(request: Request, pk: str):
-            # 每次请求创建新的 ViewSet 实例,确保无状态
-            viewset = viewset_class()
+            viewset = get_viewset()
             return await viewset.retrieve(request, pk)
 
-    def _register_update_route(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
+        router.add_api_route("/{pk}", retrieve_view, methods=["GET"], dependencies=security)
+
+    def _register_update_route(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
         """注册完整更新路由"""
-        schema = self._get_schema(viewset_class, "update")
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        schema = plan.schemas["update"]
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        @router.put("/{pk}", dependencies=security)
         async def update_view(request: Request, pk: str, update_data: schema):
-            # 每次请求创建新的 ViewSet 实例,确保无状态
-            viewset = viewset_class()
+            viewset = get_viewset()
             return await viewset.update(request, pk, update_data)
 
+        router.add_api_route("/{pk}", update_view, methods=["PUT"], dependencies=security)
+
     def _register_partial_update_route(
-        self, router: APIRouter, viewset_class: type[ViewSet]
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
     ) -> None:
         """注册部分更新路由"""
-        schema = self._get_schema(viewset_class, "update")
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        schema = plan.schemas["update"]
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        @router.patch("/{pk}", dependencies=security)
         async def partial_update_view(request: Request, pk: str, update_data: schema):
-            # 每次请求创建新的 ViewSet 实例,确保无状态
-            viewset = viewset_class()
+            viewset = get_viewset()
             return await viewset.partial_update(request, pk, update_data)
 
-    def _register_destroy_route(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
+        router.add_api_route("/{pk}", partial_update_view, methods=["PATCH"], dependencies=security)
+
+    def _register_destroy_route(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
         """注册删除路由"""
-        temp_instance = viewset_class()
-        needs_auth = any(
-            isinstance(auth_class, type)
-            and issubclass(auth_class, JWTAuthentication)
-            or isinstance(auth_class, JWTAuthentication)
-            for auth_class in temp_instance.authentication_classes
-        )
-        # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-        security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+        security = _AUTH_DEPS_JWT if plan.needs_auth else None
+        get_viewset = plan.get_viewset
 
-        @router.delete("/{pk}", dependencies=security)
         async def destroy_view(request: Request, pk: str):
-            # 每次请求创建新的 ViewSet 实例,确保无状态
-            viewset = viewset_class()
+            viewset = get_viewset()
             return await viewset.destroy(request, pk)
 
-    def _register_custom_actions(self, router: APIRouter, viewset_class: type[ViewSet]) -> None:
-        """注册自定义 action 路由"""
-        # 获取 ViewSet 类的方法(不是实例方法)
-        for attr_name in dir(viewset_class):
-            # 跳过私有方法和特殊方法
-            if attr_name.startswith("_") or attr_name in [
-                "get_queryset",
-                "get_object",
-                "get_schema",
-                "get_object_name",
-                "list",
-                "create",
-                "retrieve",
-                "update",
-                "partial_update",
-                "destroy",
-            ]:
-                continue
-
-            attr = getattr(viewset_class, attr_name)
-            if not callable(attr) or not hasattr(attr, "action"):
-                continue
-
-            methods = getattr(attr, "action_methods", ["GET"])
-            detail = getattr(attr, "action_detail", False)
-            url_path = getattr(attr, "action_url_path", attr_name.replace("_", "-"))
-            action_kwargs = getattr(attr, "action_kwargs", {})
-
-            # 构建路由路径
-            route_path = f"/{{pk}}/{url_path}" if detail else f"/{url_path}"
+        router.add_api_route("/{pk}", destroy_view, methods=["DELETE"], dependencies=security)
+
+    def _collect_actions(self, viewset_class: type[ViewSet]) -> tuple[tuple[str, Any], ...]:
+        """
+        收集 ViewSet 上使用 @action 装饰的方法
 
-            # 为每个方法创建独立的处理函数
-            # 使用默认参数来避免闭包问题
-            for method in methods:
-                # 检查 action 方法的签名
-                import inspect
-
-                sig = inspect.signature(attr)
-                # 获取原始方法的参数(不包括 self)
-                original_params = list(sig.parameters.values())[1:]  # 跳过 self
-
-                # 创建新的参数列表(用于 handler 函数)
-                handler_params = []
-                action_call_params = []
-
-                for param in original_params:
-                    if param.name in ("request", "pk"):
-                        # request 和 pk 是固定参数
-                        handler_params.append(param)
-                        action_call_params.append(param.name)
-                    else:
-                        # 其他参数需要传递给 action
-                        handler_params.append(param)
-                        action_call_params.append(param.name)
-
-                # 使用默认参数来捕获当前循环的值
-                # 在外层先复制,避免在默认参数中调用函数
-                captured_call_params = action_call_params.copy()
-                captured_func_params = handler_params.copy()
-
-                def make_handler(
-                    action_method=attr,
-                    is_detail=detail,
-                    vs_class=viewset_class,
-                    action_name=attr_name,
-                    call_params=captured_call_params,
-                    func_params=captured_func_params,
+        Args:
+            viewset_class: ViewSet 类
+
+        Returns:
+            (方法名, 方法) 元组
+
+        Raises:
+            ValueError: 多个 action 使用相同的路径和 HTTP 方法
+        """
+        # 没有定义 @action 的 ViewSet 无需扫描
+        if not getattr(viewset_class, "_has_custom_actions", False):
+            return ()
+
+        actions: dict[str, Any] = {}
+        # 沿 MRO 直接读取各类的 __dict__,避免 dir() 排序和描述符调用
+        # 子类先出现,同名方法以子类定义为准
+        for klass in viewset_class.__mro__:
+            for attr_name, attr in vars(klass).items():
+                # 跳过私有方法、特殊方法和已被子类覆盖的方法
+                if (
+                    attr_name.startswith("_")
+                    or attr_name in _RESERVED_METHOD_NAMES
+                    or attr_name in actions
                 ):
-                    async def base_handler(**kwargs):
-                        # 每次请求创建新的 ViewSet 实例,确保无状态
-                        viewset = vs_class()
-                        request = kwargs.get("request")
-
-                        # 检查限流
-                        await viewset.check_throttles(request)
-                        # 执行认证和权限检查
-                        await viewset.perform_authentication(request)
-                        await viewset.check_permissions(request, action_name)
-
-                        # 如果是对象级操作,获取对象并检查对象权限
-                        if is_detail:
-                            pk = kwargs.get("pk")
-                            instance = await viewset.get_object(pk)
-                            if instance:
-                                await viewset.check_object_permissions(
-                                    request, instance, action_name
-                                )
-
-                        # 准备调用参数
-                        call_args = [viewset]
-                        for param_name in call_params:
-                            call_args.append(kwargs.get(param_name))
-
-                        return await action_method(*call_args)
-
-                    # 设置正确的函数签名
-                    base_handler.__signature__ = inspect.Signature(parameters=func_params)
-                    return base_handler
-
-                handler = make_handler()
-
-                # 检查是否需要 JWT 认证(用于 Swagger UI 的 Authorize 按钮)
-                # 设置 auto_error=False,让我们的认证逻辑完全控制认证流程
-                temp_instance = viewset_class()
-                needs_auth = any(
-                    isinstance(auth_class, type)
-                    and issubclass(auth_class, JWTAuthentication)
-                    or isinstance(auth_class, JWTAuthentication)
-                    for auth_class in temp_instance.authentication_classes
-                )
-                security = [Security(HTTPBearer(auto_error=False))] if needs_auth else None
+                    continue
+                actions[attr_name] = attr
+
+        # 列表级(静态路径)action 先注册,对象级 action 在后,同类按方法名排序
+        collected = sorted(
+            (
+                (attr_name, attr)
+                for attr_name, attr in actions.items()
+                if callable(attr) and hasattr(attr, "action")
+            ),
+            key=lambda item: (bool(getattr(item[1], "action_detail", False)), item[0]),
+        )
 
-                # 合并安全依赖到 action_kwargs
-                route_kwargs = action_kwargs.copy()
-                if security:
-                    existing_deps = route_kwargs.get("dependencies", [])
-                    if isinstance(existing_deps, list):
-                        route_kwargs["dependencies"] = existing_deps + security
-                    else:
-                        route_kwargs["dependencies"] = security
+        # 检查路由冲突:同一路径的同一 HTTP 方法只能对应一个 action
+        registered: dict[tuple[bool, str, str], str] = {}
+        for attr_name, attr in collected:
+            detail = bool(getattr(attr, "action_detail", False))
+            for method in getattr(attr, "action_methods", ["GET"]):
+                route_key = (detail, attr.action_url_path, method.upper())
+                if route_key in registered:
+                    raise ValueError(
+                        f"{viewset_class.__name__} 的 action '{attr_name}' 与 "
+                        f"'{registered[route_key]}' 路由冲突: {method.upper()} {attr.action_url_path}"
+                    )
+                registered[route_key] = attr_name
+
+        return tuple(collected)
+
+    def _build_action_routes(
+        self,
+        viewset_class: type[ViewSet],
+        needs_auth: bool,
+        get_viewset: Callable[[], ViewSet],
+    ) -> tuple[_ActionRoute, ...]:
+        """
+        预先计算自定义 action 的路由路径、处理函数和路由参数
+
+        Args:
+            viewset_class: ViewSet 类
+            needs_auth: 是否需要添加 JWT 安全依赖
+            get_viewset: ViewSet 实例提供函数
 
+        Returns:
+            action 路由信息
+        """
+        routes = []
+        for attr_name, attr in self._collect_actions(viewset_class):
+            detail = attr.action_detail
+            url_path = attr.action_url_path
+            route_path = f"/{{pk}}/{url_path}" if detail else f"/{url_path}"
+
+            # 合并安全依赖到 action_kwargs(同一 action 的所有 HTTP 方法共用)
+            route_kwargs = attr.action_kwargs
+            if needs_auth:
+                route_kwargs = {
+                    **route_kwargs,
+                    "dependencies": list(route_kwargs.get("dependencies", ())) + _AUTH_DEPS_JWT,
+                }
+
+            # 每个 action 只生成一个处理函数,所有 HTTP 方法共用
+            handler = _compile_action_handler(attr, attr_name, detail, get_viewset)
+            routes.append(
+                _ActionRoute(route_path, tuple(attr.action_methods), handler, route_kwargs)
+            )
+        return tuple(routes)
+
+    def _register_custom_actions(
+        self, router: APIRouter, viewset_class: type[ViewSet], plan: _RegistrationPlan
+    ) -> None:
+        """注册自定义 action 路由"""
+        for route in plan.actions:
+            # 每个 HTTP 方法单独注册路由,保证 OpenAPI operationId 唯一
+            for method in route.methods:
                 router.add_api_route(
-                    route_path,
-                    handler,
+                    route.path,
+                    route.handler,
                     methods=[method],
-                    **route_kwargs,
+                    **route.route_kwargs,
                 )
 
 
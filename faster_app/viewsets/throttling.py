@@ -4,7 +4,11 @@
 提供请求频率控制功能,防止 API 被滥用。
 """
 
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from functools import lru_cache
+from time import monotonic
 from typing import TYPE_CHECKING
 
 from fastapi import Request
@@ -15,6 +19,33 @@ if TYPE_CHECKING:
     from faster_app.viewsets.base import ViewSet
 
 
+# 速率时间单位映射(秒)
+_PERIOD_MAP = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def _user_id(request: Request) -> str | None:
+    """
+    获取已认证用户的 ID
+
+    Args:
+        request: FastAPI 请求对象
+
+    Returns:
+        用户 ID 字符串,未认证或用户没有 ID 时返回 None
+    """
+    user = getattr(request.state, "user", None)
+    if user:
+        user_id = getattr(user, "id", None)
+        if user_id:
+            return str(user_id)
+    return None
+
+
 class BaseThrottle(ABC):
     """
     限流基类
@@ -22,6 +53,12 @@ class BaseThrottle(ABC):
     所有限流类都应继承此类,实现限流逻辑。
     """
 
+    # 基类不创建 __dict__,无状态的子类(如 NoThrottle)可以保持无 __dict__
+    __slots__ = ()
+
+    # 为 True 时 ViewSet.check_throttles 直接跳过该限流,不调用 allow_request
+    disabled: bool = False
+
     @abstractmethod
     async def allow_request(self, request: Request, view: "ViewSet") -> bool:
         """
@@ -50,10 +87,9 @@ class BaseThrottle(ABC):
             唯一标识字符串(通常是 IP 地址或用户 ID)
         """
         # 优先使用用户 ID
-        if hasattr(request.state, "user") and request.state.user:
-            user_id = getattr(request.state.user, "id", None)
-            if user_id:
-                return str(user_id)
+        user_id = _user_id(request)
+        if user_id:
+            return user_id
 
         # 否则使用 IP 地址
         if request.client:
@@ -71,6 +107,105 @@ class BaseThrottle(ABC):
         return None
 
 
+class BaseThrottleBackend(ABC):
+    """
+    限流存储后端基类
+
+    负责记录请求历史并判断是否超过速率限制。默认使用进程内的 MemoryThrottleBackend,
+    多进程/多实例部署时可以实现基于 Redis 等外部存储的后端(如 INCR + EXPIRE)。
+    """
+
+    @abstractmethod
+    async def allow(self, key: str, num_requests: int, duration: int, now: float) -> bool:
+        """
+        记录一次请求并检查是否允许
+
+        Args:
+            key: 缓存键
+            num_requests: 时间窗口内允许的请求数
+            duration: 时间窗口秒数
+            now: 当前时间(time.monotonic(),仅在当前进程内可比较)
+
+        Returns:
+            True 表示允许请求,False 表示需要限流
+        """
+        pass
+
+
+class MemoryThrottleBackend(BaseThrottleBackend):
+    """
+    进程内限流存储后端
+
+    使用滑动窗口记录请求时间戳,按最近访问顺序(LRU)淘汰超出容量的键,
+    避免大量不同客户端导致内存无限增长。
+
+    缓存键按哈希分散到多个分片,每个分片有独立的锁和 LRU 容量,
+    多线程并发时不同客户端的请求不会争用同一把锁。
+    """
+
+    def __init__(self, maxsize: int = 100_000, shards: int = 16):
+        """
+        初始化内存限流后端
+
+        Args:
+            maxsize: 最多保存的缓存键数量(平均分配到各分片)
+            shards: 分片数量
+        """
+        self.maxsize = maxsize
+        self._shard_maxsize = max(1, -(-maxsize // shards))
+        self._shards: tuple[OrderedDict[str, deque[float]], ...] = tuple(
+            OrderedDict() for _ in range(shards)
+        )
+        # 检查和记录在分片锁内完成,临界区内没有 await,不会阻塞事件循环
+        self._locks = tuple(threading.Lock() for _ in range(shards))
+
+    async def allow(self, key: str, num_requests: int, duration: int, now: float) -> bool:
+        """
+        记录一次请求并检查是否允许
+
+        Args:
+            key: 缓存键
+            num_requests: 时间窗口内允许的请求数
+            duration: 时间窗口秒数
+            now: 当前时间(time.monotonic(),仅在当前进程内可比较)
+
+        Returns:
+            True 表示允许请求,False 表示需要限流
+        """
+        cutoff = now - duration
+        index = hash(key) % len(self._shards)
+        cache = self._shards[index]
+        with self._locks[index]:
+            history = cache.get(key)
+            if history is None:
+                # 不设置 maxlen: 同一个键可能被不同速率检查(共享 scope 或运行时调整速率),
+                # 长度由下面的 num_requests 检查约束
+                history = cache[key] = deque()
+                # 超出分片容量时淘汰最久未访问的键
+                if len(cache) > self._shard_maxsize:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+
+            # 清理过期记录(时间戳按顺序追加,只需从队头弹出)
+            while history and history[0] <= cutoff:
+                history.popleft()
+
+            # 检查是否超过限制
+            if len(history) >= num_requests:
+                return False
+
+            # 记录本次请求
+            history.append(now)
+            return True
+
+    def clear(self) -> None:
+        """清空所有限流记录"""
+        for cache, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                cache.clear()
+
+
 class SimpleRateThrottle(BaseThrottle):
     """
     简单速率限流
@@ -80,7 +215,10 @@ class SimpleRateThrottle(BaseThrottle):
 
     scope: str = ""
     rate: str = ""  # 格式：'100/hour', '1000/day', '10/minute'
-    _cache: dict[str, list[float]] = {}  # 简单的内存缓存
+    # 限流存储后端(类级别共享),多进程部署可替换为 Redis 等外部存储
+    cache_backend: BaseThrottleBackend = MemoryThrottleBackend(
+        maxsize=configs.throttle.cache_maxsize
+    )
 
     def __init__(self, rate: str | None = None, scope: str | None = None):
         """
@@ -95,9 +233,11 @@ class SimpleRateThrottle(BaseThrottle):
         if scope is not None:
             self.scope = scope
 
-    def parse_rate(self, rate: str) -> tuple[int, int]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def parse_rate(rate: str) -> tuple[int | None, int | None]:
         """
-        解析速率字符串
+        解析速率字符串(结果按速率字符串缓存)
 
         Args:
             rate: 速率字符串,如 '100/hour'
@@ -111,15 +251,7 @@ class SimpleRateThrottle(BaseThrottle):
         num, period = rate.split("/")
         num_requests = int(num)
 
-        # 时间单位映射
-        period_map = {
-            "second": 1,
-            "minute": 60,
-            "hour": 3600,
-            "day": 86400,
-        }
-
-        period_seconds = period_map.get(period.lower(), 1)
+        period_seconds = _PERIOD_MAP.get(period.lower(), 1)
         return (num_requests, period_seconds)
 
     def get_rate(self, view: "ViewSet") -> str:
@@ -184,34 +316,14 @@ class SimpleRateThrottle(BaseThrottle):
             return True
 
         num_requests, duration = self.parse_rate(rate)
-        if num_requests is None:
+        if num_requests is None or duration is None:
             return True
 
         # 获取缓存键
         key = self.get_cache_key(request, view)
 
-        # 获取当前时间戳
-        import time
-
-        now = time.time()
-
-        # 从缓存中获取请求历史(Python 的 dict 操作在 GIL 下基本是原子的)
-        # 对于简单的计数器操作,不需要额外的锁
-        if key not in self._cache:
-            self._cache[key] = []
-
-        # 清理过期记录
-        cutoff = now - duration
-        self._cache[key] = [timestamp for timestamp in self._cache[key] if timestamp > cutoff]
-
-        # 检查是否超过限制
-        if len(self._cache[key]) >= num_requests:
-            return False
-
-        # 记录本次请求
-        self._cache[key].append(now)
-
-        return True
+        # 使用单调时钟,不受系统时间调整影响
+        return await self.cache_backend.allow(key, num_requests, duration, monotonic())
 
     def wait(self) -> int | None:
         """
@@ -245,11 +357,7 @@ class UserRateThrottle(SimpleRateThrottle):
         Returns:
             缓存键字符串
         """
-        if hasattr(request.state, "user") and request.state.user:
-            user_id = getattr(request.state.user, "id", None)
-            ident = str(user_id) if user_id else self.get_ident(request)
-        else:
-            ident = self.get_ident(request)
+        ident = _user_id(request) or self.get_ident(request)
 
         scope = self.scope or getattr(view, "throttle_scope", "user")
         return f"throttle_{scope}_{ident}"
@@ -266,7 +374,7 @@ class UserRateThrottle(SimpleRateThrottle):
             True 表示允许请求,False 表示需要限流
         """
         # 如果未认证,不进行限流(由 AnonRateThrottle 处理)
-        if not hasattr(request.state, "user") or not request.state.user:
+        if not getattr(request.state, "user", None):
             return True
 
         return await super().allow_request(request, view)
@@ -293,7 +401,7 @@ class AnonRateThrottle(SimpleRateThrottle):
             True 表示允许请求,False 表示需要限流
         """
         # 如果已认证,不进行限流(由 UserRateThrottle 处理)
-        if hasattr(request.state, "user") and request.state.user:
+        if getattr(request.state, "user", None):
             return True
 
         return await super().allow_request(request, view)
@@ -405,5 +513,8 @@ class NoThrottle(BaseThrottle):
     不进行任何限流检查。
     """
 
+    __slots__ = ()
+    disabled = True
+
     async def allow_request(self, request: Request, view: "ViewSet") -> bool:
         return True